@@ -3,7 +3,7 @@ import * as dotenv from "dotenv";
 import { Hono } from "hono";
 import { cors } from "hono/cors";
 import { sign, verify } from "jsonwebtoken";
-import { Collection, Db, MongoClient } from "mongodb";
+import { Collection, Db, MongoBulkWriteError, MongoClient } from "mongodb";
 import * as nodeCrypto from "crypto";
 // Dynamic require to avoid type issues if @types not installed
 // eslint-disable-next-line @typescript-eslint/no-var-requires
@@ -16,9 +16,15 @@ const SECRET_KEY = process.env.SECRET_KEY || "";
 const ACCESS_TOKEN_EXPIRE_MINUTES = Number(
 	process.env.ACCESS_TOKEN_EXPIRE_MINUTES || "60"
 );
+// Mixed into password hashes; changing it invalidates every stored password.
+const PASSWORD_PEPPER = process.env.PASSWORD_PEPPER || "";
 const MONGO_URL = process.env.MONGO_URL || "";
+const MONGO_MAX_POOL_SIZE = Number(process.env.MONGO_MAX_POOL_SIZE || "50");
+const MONGO_MIN_POOL_SIZE = Number(process.env.MONGO_MIN_POOL_SIZE || "10");
 if (!SECRET_KEY) throw new Error("SECRET_KEY not set in backend/.env");
 if (!MONGO_URL) throw new Error("MONGO_URL not set in backend/.env");
+if (!PASSWORD_PEPPER)
+	throw new Error("PASSWORD_PEPPER not set in backend/.env");
 
 // Cloudinary env (optional but required for media uploads)
 const CLOUDINARY_CLOUD_NAME = process.env.CLOUDINARY_CLOUD_NAME || "";
@@ -111,29 +117,203 @@ let db: Db;
 let usersCol: Collection<UserDoc>;
 let complaintsCol: Collection<ComplaintDoc>;
 
-async function getDb(): Promise<Db> {
-	if (!client) {
-		client = new MongoClient(MONGO_URL);
-		await client.connect();
-		const url = new URL(MONGO_URL);
-		const dbName = (url.pathname || "/").replace(/^\//, "");
-		if (!dbName) throw new Error("Database name missing in MONGO_URL");
-		db = client.db(dbName);
-		usersCol = db.collection<UserDoc>("users");
-		complaintsCol = db.collection<ComplaintDoc>("complaints");
-		// Indexes
-		await usersCol.createIndex({ email: 1 }, { unique: true });
-		await complaintsCol.createIndex({ studentId: 1 });
-		await complaintsCol.createIndex({ createdAt: -1 });
-	}
+async function connectDb(): Promise<Db> {
+	// Explicit pool limits and timeouts so a burst of slow queries fails fast
+	// instead of queueing every other request behind it.
+	client = new MongoClient(MONGO_URL, {
+		maxPoolSize: MONGO_MAX_POOL_SIZE,
+		minPoolSize: MONGO_MIN_POOL_SIZE,
+		waitQueueTimeoutMS: 2000,
+		serverSelectionTimeoutMS: 3000,
+		connectTimeoutMS: 2000,
+		socketTimeoutMS: 10000,
+		retryWrites: true,
+		compressors: ["zlib"],
+	});
+	await client.connect();
+	const url = new URL(MONGO_URL);
+	const dbName = (url.pathname || "/").replace(/^\//, "");
+	if (!dbName) throw new Error("Database name missing in MONGO_URL");
+	db = client.db(dbName);
+	usersCol = db.collection<UserDoc>("users");
+	complaintsCol = db.collection<ComplaintDoc>("complaints");
+	// Indexes
+	await usersCol.createIndex({ email: 1 }, { unique: true });
+	await complaintsCol.createIndex({ createdAt: -1 });
+	await complaintsCol.createIndex({ id: 1, studentId: 1 });
+	await complaintsCol.createIndex({ studentId: 1, createdAt: -1 });
+	await complaintsCol.createIndex({ studentId: 1, status: 1, createdAt: -1 });
+	await complaintsCol.createIndex({ status: 1, createdAt: -1 });
+	// Superseded by the studentId compound indexes above; code 27 is
+	// IndexNotFound, i.e. it was already dropped.
+	await complaintsCol.dropIndex("studentId_1").catch((err) => {
+		if (err?.code !== 27) throw err;
+	});
+	// Best-effort warm-up: minPoolSize fills the pool in the background, but a
+	// few concurrent pings get the first connections open before real traffic
+	// (the driver only opens a couple at a time, so most pings share them).
+	// A failed ping must not fail initialization.
+	await Promise.allSettled(
+		Array.from({ length: MONGO_MIN_POOL_SIZE }, () => db.command({ ping: 1 }))
+	);
 	return db;
 }
 
+// Shared so concurrent first requests wait on one connection attempt.
+let dbReady: Promise<Db> | null = null;
+
+function getDb(): Promise<Db> {
+	if (!dbReady) {
+		dbReady = connectDb().catch((err) => {
+			// Allow the next request to retry with a fresh client
+			client?.close().catch(() => {});
+			client = null;
+			dbReady = null;
+			throw err;
+		});
+	}
+	return dbReady;
+}
+
+// Complaints are returned to clients exactly as stored; leaving out the Mongo
+// _id means documents need no reshaping (or ObjectId decoding) on the way out.
+const complaintProjection = { _id: 0 };
+
 // Helpers
+// jsonwebtoken tries to parse string secrets as PEM keys on every call before
+// falling back to HMAC; handing it a prebuilt secret KeyObject skips that.
+const JWT_KEY = nodeCrypto.createSecretKey(Buffer.from(SECRET_KEY));
+
+// Unix time in whole seconds, as used by JWT exp and Cloudinary signatures.
+const nowSeconds = () => Math.floor(Date.now() / 1000);
+
 const createAccessToken = (sub: string) => {
-	const expSeconds =
-		Math.floor(Date.now() / 1000) + ACCESS_TOKEN_EXPIRE_MINUTES * 60;
-	return sign({ sub, exp: expSeconds }, SECRET_KEY);
+	const expSeconds = nowSeconds() + ACCESS_TOKEN_EXPIRE_MINUTES * 60;
+	return sign({ sub, exp: expSeconds }, JWT_KEY, { algorithm: "HS256" });
+};
+
+// Passwords. Bun ships a native bcrypt; bcryptjs is the pure-JS fallback for
+// other runtimes and for legacy inputs the native path would hash differently.
+// All bcrypt calls are async so hashing never blocks the event loop: Bun runs
+// bcrypt on its worker pool and bcryptjs yields between rounds.
+const BCRYPT_ROUNDS = 10;
+const nativePassword =
+	// @ts-ignore - Bun global exists when running under Bun
+	typeof Bun !== "undefined" ? (Bun as any).password : null;
+
+// Current hashes are "v2$" + bcrypt(base64(HMAC-SHA256(pepper, password))).
+// The digest is a fixed 44 bytes, so bcrypt cost no longer depends on the
+// password length and long passwords are no longer truncated. Hashes without
+// the prefix are plain bcrypt and get upgraded on the next login.
+const PEPPERED_PREFIX = "v2$";
+// Cost field ("$10$" in "$2b$10$...") of hashes made with the current cost
+const CURRENT_COST_MARKER = `$${String(BCRYPT_ROUNDS).padStart(2, "0")}$`;
+
+const pepperPassword = (password: string) =>
+	nodeCrypto
+		.createHmac("sha256", PASSWORD_PEPPER)
+		.update(password)
+		.digest("base64");
+
+// Digests always fit bcrypt's input limit, so their implementation is picked
+// once at load instead of being re-decided on every call.
+const hashDigest: (digest: string) => Promise<string> = nativePassword
+	? (digest) =>
+			nativePassword.hash(digest, {
+				algorithm: "bcrypt",
+				cost: BCRYPT_ROUNDS,
+			})
+	: (digest) => bcrypt.hash(digest, BCRYPT_ROUNDS);
+
+const verifyDigest: (digest: string, hash: string) => Promise<boolean> =
+	nativePassword
+		? (digest, hash) => nativePassword.verify(digest, hash)
+		: (digest, hash) => bcrypt.compare(digest, hash);
+
+// Bun pre-hashes inputs over bcrypt's 72-byte limit while bcryptjs truncates
+// them, so legacy hashes of long passwords must be checked with bcryptjs.
+const verifyLegacy = (password: string, hash: string): Promise<boolean> =>
+	nativePassword && Buffer.byteLength(password) <= 72
+		? nativePassword.verify(password, hash)
+		: bcrypt.compare(password, hash);
+
+const hashPassword = async (password: string): Promise<string> =>
+	PEPPERED_PREFIX + (await hashDigest(pepperPassword(password)));
+
+const verifyPassword = (password: string, hash: string): Promise<boolean> =>
+	hash.startsWith(PEPPERED_PREFIX)
+		? verifyDigest(
+				pepperPassword(password),
+				hash.slice(PEPPERED_PREFIX.length)
+		  )
+		: verifyLegacy(password, hash);
+
+// Legacy hashes, or ones created with a different cost, are re-hashed on the
+// next successful login. The cost sits right after the "$2b" version tag.
+const needsRehash = (hash: string) =>
+	!hash.startsWith(PEPPERED_PREFIX) ||
+	!hash.startsWith(CURRENT_COST_MARKER, PEPPERED_PREFIX.length + 3);
+
+// Small in-memory TTL cache. Expired entries are dropped lazily on read and
+// the oldest entry is evicted once maxSize is reached.
+class TtlCache<V> {
+	private entries = new Map<string, { value: V; expiresAt: number }>();
+
+	constructor(private maxSize: number, private ttlMs: number) {}
+
+	get(key: string): V | undefined {
+		const entry = this.entries.get(key);
+		if (!entry) return undefined;
+		if (entry.expiresAt <= Date.now()) {
+			this.entries.delete(key);
+			return undefined;
+		}
+		return entry.value;
+	}
+
+	set(key: string, value: V, ttlMs = this.ttlMs) {
+		this.entries.delete(key);
+		if (this.entries.size >= this.maxSize) {
+			const oldest = this.entries.keys().next().value;
+			if (oldest !== undefined) this.entries.delete(oldest);
+		}
+		this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+	}
+
+	deleteWhere(predicate: (value: V) => boolean) {
+		for (const [key, entry] of this.entries) {
+			if (predicate(entry.value)) this.entries.delete(key);
+		}
+	}
+}
+
+// Recently verified logins, keyed by sha256(email + stored hash + password).
+// The stored hash is part of the key, so a password change misses the cache.
+const loginCache = new TtlCache<true>(10000, 30_000);
+// In-flight checks, so concurrent identical logins share one bcrypt run.
+const pendingLogins = new Map<string, Promise<boolean>>();
+
+const checkLogin = async (
+	email: string,
+	password: string,
+	passwordHash: string
+): Promise<boolean> => {
+	const key = nodeCrypto
+		.createHash("sha256")
+		.update(`${email}\0${passwordHash}\0${password}`)
+		.digest("hex");
+	if (loginCache.get(key)) return true;
+	let pending = pendingLogins.get(key);
+	if (!pending) {
+		pending = verifyPassword(password, passwordHash)
+			.then((ok) => {
+				if (ok) loginCache.set(key, true);
+				return ok;
+			})
+			.finally(() => pendingLogins.delete(key));
+		pendingLogins.set(key, pending);
+	}
+	return pending;
 };
 
 // Utility for generating a Cloudinary upload signature on the server.
@@ -146,20 +326,47 @@ function generateCloudinarySignature(params: Record<string, any>): string {
 	return nodeCrypto.createHash("sha1").update(toSign).digest("hex");
 }
 
+// Resolved users keyed by sha256(token), so authenticated requests skip JWT
+// verification and the users lookup. Entries never outlive the token's exp.
+const tokenCache = new TtlCache<UserOut>(10000, 30_000);
+
+const tokenCacheKey = (token: string) =>
+	nodeCrypto.createHash("sha256").update(token).digest("hex");
+
+// Per-user invalidation counter. A lookup only caches its result if the
+// counter is unchanged, so a read that raced an update or delete can't put the
+// stale user back into the cache.
+const userGenerations = new Map<string, number>();
+const userGeneration = (userId: string) => userGenerations.get(userId) ?? 0;
+
+// Drop cached sessions for a user whose record was changed or removed.
+const invalidateUserSessions = (userId: string) => {
+	userGenerations.set(userId, userGeneration(userId) + 1);
+	tokenCache.deleteWhere((u) => u.id === userId);
+};
+
 const getCurrentUser = async (c: any): Promise<UserOut | null> => {
 	const auth = c.req.header("authorization") || "";
 	const m = auth.match(/^Bearer\s+(.+)$/i);
 	if (!m) return null;
+	const key = tokenCacheKey(m[1]);
+	const cached = tokenCache.get(key);
+	if (cached) return cached;
 	try {
-		const payload = verify(m[1], SECRET_KEY) as any;
+		const payload = verify(m[1], JWT_KEY, { algorithms: ["HS256"] }) as any;
 		const sub = payload?.sub;
-		if (!sub) return null;
+		if (!sub || typeof payload.exp !== "number") return null;
+		const generation = userGeneration(String(sub));
 		await getDb();
 		const user = await usersCol.findOne(
 			{ id: String(sub) },
-			{ projection: { password_hash: 0 } as any }
+			{ projection: { _id: 0, password_hash: 0 } as any }
 		);
-		return (user as any) || null;
+		if (!user) return null;
+		const ttlMs = Math.min(30_000, Number(payload.exp) * 1000 - Date.now());
+		if (ttlMs > 0 && userGeneration(String(sub)) === generation)
+			tokenCache.set(key, user as any, ttlMs);
+		return user as any;
 	} catch {
 		return null;
 	}
@@ -198,7 +405,7 @@ app.post("/api/uploads/signature", async (c) => {
 	}
 	const body = await c.req.json().catch(() => ({}));
 	const { resource_type = "image" } = body as { resource_type?: string };
-	const timestamp = Math.floor(Date.now() / 1000);
+	const timestamp = nowSeconds();
 	const folder = CLOUDINARY_UPLOAD_FOLDER;
 	const paramsToSign: Record<string, any> = { folder, timestamp }; // unsigned preset not used; we sign
 	// Optional: restrict resource_type by not including it in signature (Cloudinary docs: only signed params matter)
@@ -227,10 +434,10 @@ app.post("/api/auth/register", async (c) => {
 	if (!name || !email || !password || !role)
 		return c.json({ detail: "Missing required fields" }, 400);
 	await getDb();
-	const existing = await usersCol.findOne({ email });
+	const existing = await usersCol.findOne({ email }, { projection: { _id: 1 } });
 	if (existing) return c.json({ detail: "User already exists" }, 400);
 	const id = crypto.randomUUID();
-	const password_hash = bcrypt.hashSync(password, 10);
+	const password_hash = await hashPassword(password);
 	const user: UserDoc = {
 		id,
 		name,
@@ -251,10 +458,19 @@ app.post("/api/auth/login", async (c) => {
 	const username = String((form as any)?.username || "");
 	const password = String((form as any)?.password || "");
 	await getDb();
-	const user = await usersCol.findOne({ email: username });
-	if (!user || !bcrypt.compareSync(password, user.password_hash)) {
+	const user = await usersCol.findOne(
+		{ email: username },
+		{ projection: { _id: 0, id: 1, password_hash: 1 } }
+	);
+	if (!user || !(await checkLogin(username, password, user.password_hash))) {
 		return c.json({ detail: "Incorrect email or password" }, 400);
 	}
+	if (needsRehash(user.password_hash)) {
+		await usersCol.updateOne(
+			{ id: user.id },
+			{ $set: { password_hash: await hashPassword(password) } }
+		);
+	}
 	const access_token = createAccessToken(user.id);
 	return c.json({ access_token, token_type: "bearer" });
 });
@@ -266,6 +482,57 @@ app.get("/api/auth/me", async (c) => {
 	return c.json(u);
 });
 
+// Complaint inserts are coalesced into insertMany calls so bursts of new
+// complaints share round trips. A batch is flushed INSERT_FLUSH_MS after its
+// first document arrives, or as soon as INSERT_BATCH_MAX are queued.
+const INSERT_FLUSH_MS = 2;
+const INSERT_BATCH_MAX = 100;
+
+type PendingInsert = {
+	doc: ComplaintDoc;
+	resolve: () => void;
+	reject: (err: unknown) => void;
+};
+
+let pendingInserts: PendingInsert[] = [];
+let insertTimer: ReturnType<typeof setTimeout> | null = null;
+
+const flushComplaintInserts = async () => {
+	if (insertTimer) clearTimeout(insertTimer);
+	insertTimer = null;
+	const batch = pendingInserts;
+	pendingInserts = [];
+	if (!batch.length) return;
+	try {
+		// Let the server assign _id so each doc goes back to the client unmodified.
+		await complaintsCol.insertMany(
+			batch.map((p) => p.doc),
+			{ ordered: false, forceServerObjectId: true }
+		);
+		batch.forEach((p) => p.resolve());
+	} catch (err) {
+		// Unordered inserts still write the rest of the batch, so only fail the
+		// documents the server rejected. Anything else fails the whole batch.
+		const failed = new Map<number, unknown>();
+		if (err instanceof MongoBulkWriteError) {
+			for (const e of [err.writeErrors].flat()) failed.set(e.index, e);
+		}
+		batch.forEach((p, i) => {
+			if (!failed.size) p.reject(err);
+			else if (failed.has(i)) p.reject(failed.get(i));
+			else p.resolve();
+		});
+	}
+};
+
+const queueComplaintInsert = (doc: ComplaintDoc) =>
+	new Promise<void>((resolve, reject) => {
+		pendingInserts.push({ doc, resolve, reject });
+		if (pendingInserts.length >= INSERT_BATCH_MAX) void flushComplaintInserts();
+		else if (!insertTimer)
+			insertTimer = setTimeout(flushComplaintInserts, INSERT_FLUSH_MS);
+	});
+
 // Complaints: Create
 app.post("/api/complaints", async (c) => {
 	const u = await getCurrentUser(c);
@@ -316,26 +583,55 @@ app.post("/api/complaints", async (c) => {
 		feedback: null,
 		media: sanitizedMedia,
 	};
-	await complaintsCol.insertOne(doc);
+	await queueComplaintInsert(doc);
 	return c.json(doc);
 });
 
 // Complaints: List
+const DEFAULT_COMPLAINTS_PAGE = 50;
+const MAX_COMPLAINTS_PAGE = 500;
+
+// Index matching each list query shape, so results come back already sorted.
+const complaintListHint = (query: { studentId?: string; status?: string }) =>
+	query.studentId
+		? query.status
+			? { studentId: 1, status: 1, createdAt: -1 }
+			: { studentId: 1, createdAt: -1 }
+		: query.status
+		? { status: 1, createdAt: -1 }
+		: { createdAt: -1 };
+
 app.get("/api/complaints", async (c) => {
 	const u = await getCurrentUser(c);
 	if (!u) return c.json({ detail: "Could not validate credentials" }, 401);
 	const status_filter = c.req.query("status_filter") as
 		| ComplaintStatus
 		| undefined;
+	const limit = Math.min(
+		Math.max(
+			Math.floor(Number(c.req.query("limit")) || DEFAULT_COMPLAINTS_PAGE),
+			1
+		),
+		MAX_COMPLAINTS_PAGE
+	);
+	const skip = Number(c.req.query("skip") || "0");
+	if (!Number.isSafeInteger(skip) || skip < 0)
+		return c.json({ detail: "skip must be a non-negative integer" }, 400);
 	await getDb();
 	const query: any = {};
 	if (u.role !== "admin") query.studentId = u.id;
 	if (status_filter) query.status = status_filter;
+	// Fetch one extra item to learn whether another page exists.
 	const items = await complaintsCol
-		.find(query)
+		.find(query, { projection: complaintProjection })
 		.sort({ createdAt: -1 })
+		.hint(complaintListHint(query))
+		.skip(skip)
+		.limit(limit + 1)
 		.toArray();
-	return c.json(items);
+	const hasMore = items.length > limit;
+	if (hasMore) items.pop();
+	return c.json({ items, nextCursor: hasMore ? skip + limit : null });
 });
 
 // Complaints: Get by id
@@ -344,10 +640,14 @@ app.get("/api/complaints/:id", async (c) => {
 	if (!u) return c.json({ detail: "Could not validate credentials" }, 401);
 	const id = c.req.param("id");
 	await getDb();
-	const doc = await complaintsCol.findOne({ id });
+	// Ownership is part of the filter; other students' complaints read as 404
+	// so their existence isn't leaked.
+	const query: any = { id };
+	if (u.role !== "admin") query.studentId = u.id;
+	const doc = await complaintsCol.findOne(query, {
+		projection: complaintProjection,
+	});
 	if (!doc) return c.json({ detail: "Complaint not found" }, 404);
-	if (u.role !== "admin" && doc.studentId !== u.id)
-		return c.json({ detail: "Not authorized to view this complaint" }, 403);
 	return c.json(doc);
 });
 
@@ -366,7 +666,7 @@ app.patch("/api/complaints/:id/status", async (c) => {
 	const res = await complaintsCol.findOneAndUpdate(
 		{ id },
 		{ $set: { status: new_status, updatedAt: now } },
-		{ returnDocument: "after" }
+		{ returnDocument: "after", projection: complaintProjection }
 	);
 	const doc = res;
 	if (!doc) return c.json({ detail: "Complaint not found" }, 404);
@@ -397,7 +697,7 @@ app.post("/api/complaints/:id/responses", async (c) => {
 	const res = await complaintsCol.findOneAndUpdate(
 		{ id },
 		{ $push: { responses: response }, $set: { updatedAt: now } },
-		{ returnDocument: "after" }
+		{ returnDocument: "after", projection: complaintProjection }
 	);
 	const doc = res;
 	if (!doc) return c.json({ detail: "Complaint not found" }, 404);
@@ -415,18 +715,18 @@ app.post("/api/complaints/:id/feedback", async (c) => {
 	if (typeof rating !== "number" || rating < 1 || rating > 5 || !comment)
 		return c.json({ detail: "Invalid feedback" }, 400);
 	await getDb();
-	const comp = await complaintsCol.findOne({ id });
-	if (!comp) return c.json({ detail: "Complaint not found" }, 404);
-	if (comp.studentId !== u.id)
-		return c.json({ detail: "Only the complaint owner can add feedback" }, 403);
 	const now = new Date();
-	const res = await complaintsCol.findOneAndUpdate(
-		{ id },
+	// Ownership is part of the filter, so the check and the write are atomic.
+	const doc = await complaintsCol.findOneAndUpdate(
+		{ id, studentId: u.id },
 		{ $set: { feedback: { rating, comment }, updatedAt: now } },
-		{ returnDocument: "after" }
+		{ returnDocument: "after", projection: complaintProjection }
 	);
-	const doc = res;
-	if (!doc) return c.json({ detail: "Complaint not found after update" }, 404);
+	if (!doc) {
+		const exists = await complaintsCol.countDocuments({ id }, { limit: 1 });
+		if (!exists) return c.json({ detail: "Complaint not found" }, 404);
+		return c.json({ detail: "Only the complaint owner can add feedback" }, 403);
+	}
 	return c.json(doc);
 });
 
@@ -467,11 +767,11 @@ app.post("/api/admins", async (c) => {
 	if (!name || !email || !password)
 		return c.json({ detail: "Missing required fields" }, 400);
 	await getDb();
-	const existing = await usersCol.findOne({ email });
+	const existing = await usersCol.findOne({ email }, { projection: { _id: 1 } });
 	if (existing)
 		return c.json({ detail: "User with this email already exists" }, 400);
 	const id = crypto.randomUUID();
-	const password_hash = bcrypt.hashSync(password, 10);
+	const password_hash = await hashPassword(password);
 	const doc: UserDoc = {
 		id,
 		name,
@@ -514,7 +814,7 @@ app.patch("/api/admins/:id", async (c) => {
 	if (name !== undefined) updates.name = name;
 	if (email !== undefined) updates.email = email;
 	if (department !== undefined) updates.department = department;
-	if (password) updates.password_hash = bcrypt.hashSync(password, 10);
+	if (password) updates.password_hash = await hashPassword(password);
 	if (Object.keys(updates).length === 0)
 		return c.json({ detail: "No updates provided" }, 400);
 	const result = await usersCol.findOneAndUpdate(
@@ -524,6 +824,7 @@ app.patch("/api/admins/:id", async (c) => {
 	);
 	const doc = result as any;
 	if (!doc) return c.json({ detail: "Admin not found" }, 404);
+	invalidateUserSessions(id);
 	return c.json(doc);
 });
 
@@ -545,6 +846,7 @@ app.delete("/api/admins/:id", async (c) => {
 		return c.json({ detail: "Cannot delete the last remaining admin" }, 400);
 	const res = await usersCol.deleteOne({ id, role: "admin" });
 	if (!res.deletedCount) return c.json({ detail: "Admin not found" }, 404);
+	invalidateUserSessions(id);
 	return c.json({ ok: true });
 });
 
@@ -592,12 +894,13 @@ app.delete("/api/students/:id", async (c) => {
 		return c.json({ detail: "Admin privileges required" }, 403);
 	const id = c.req.param("id");
 	await getDb();
-	const target = await usersCol.findOne({ id });
+	const target = await usersCol.findOne({ id }, { projection: { role: 1 } });
 	if (!target) return c.json({ detail: "User not found" }, 404);
 	if (target.role !== "student")
 		return c.json({ detail: "Only students can be deleted here" }, 400);
 	const res = await usersCol.deleteOne({ id, role: "student" });
 	if (!res.deletedCount) return c.json({ detail: "Student not found" }, 404);
+	invalidateUserSessions(id);
 	return c.json({ ok: true });
 });
 
@@ -737,6 +1040,17 @@ const openapiSpec: any = {
 					"responses",
 				],
 			},
+			ComplaintPage: {
+				type: "object",
+				properties: {
+					items: {
+						type: "array",
+						items: { $ref: "#/components/schemas/Complaint" },
+					},
+					nextCursor: { type: ["integer", "null"] },
+				},
+				required: ["items", "nextCursor"],
+			},
 			RegisterBody: {
 				type: "object",
 				properties: {
@@ -923,16 +1237,37 @@ const openapiSpec: any = {
 						in: "query",
 						schema: { $ref: "#/components/schemas/ComplaintStatus" },
 					},
+					{
+						name: "limit",
+						in: "query",
+						schema: {
+							type: "integer",
+							minimum: 1,
+							maximum: 500,
+							default: 50,
+						},
+					},
+					{
+						name: "skip",
+						in: "query",
+						description: "Offset; pass the previous page's nextCursor",
+						schema: { type: "integer", minimum: 0, default: 0 },
+					},
 				],
 				responses: {
 					"200": {
-						description: "List",
+						description: "Page of complaints",
 						content: {
 							"application/json": {
-								schema: {
-									type: "array",
-									items: { $ref: "#/components/schemas/Complaint" },
-								},
+								schema: { $ref: "#/components/schemas/ComplaintPage" },
+							},
+						},
+					},
+					"400": {
+						description: "Invalid skip",
+						content: {
+							"application/json": {
+								schema: { $ref: "#/components/schemas/Error" },
 							},
 						},
 					},
@@ -1014,14 +1349,6 @@ const openapiSpec: any = {
 							},
 						},
 					},
-					"403": {
-						description: "Forbidden",
-						content: {
-							"application/json": {
-								schema: { $ref: "#/components/schemas/Error" },
-							},
-						},
-					},
 					"404": {
 						description: "Not Found",
 						content: {
@@ -1518,7 +1845,11 @@ const openapiSpec: any = {
 	},
 };
 
-app.get("/api/openapi.json", (c) => c.json(openapiSpec));
+// The spec is static, so serialize it once instead of on every request.
+const openapiJson = JSON.stringify(openapiSpec);
+app.get("/api/openapi.json", (c) =>
+	c.body(openapiJson, 200, { "Content-Type": "application/json" })
+);
 
 const swaggerHtml = `<!DOCTYPE html>
 <html>
@@ -1549,4 +1880,6 @@ const port = Number(8787);
 if (typeof Bun !== "undefined" && (Bun as any)?.serve) {
 	// @ts-ignore - types provided by @types/bun in devDependencies
 	Bun.serve({ port, fetch: app.fetch });
+	// Connect and warm the pool before the first request arrives
+	getDb().catch((err) => console.error("MongoDB warm-up failed", err));
 }
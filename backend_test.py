@@ -112,8 +112,9 @@ def test_list_complaints(token):
         response = requests.get(f"{BASE_URL}/api/complaints", headers=headers)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         data = response.json()
-        assert isinstance(data, list), f"Expected list, got {type(data)}"
-        assert len(data) == 1, f"Expected 1 complaint, got {len(data)}"
+        assert isinstance(data.get("items"), list), f"Expected items list, got {data}"
+        assert len(data["items"]) == 1, f"Expected 1 complaint, got {len(data['items'])}"
+        assert data.get("nextCursor") is None, f"Expected no next page, got {data.get('nextCursor')}"
         print("✅ Complaint listing passed")
         return True
     except Exception as e:
@@ -217,6 +218,53 @@ def test_negative_student_status_update(student_token, complaint_id):
         print(f"❌ Negative test failed: {e}")
         return False
 
+def test_paginate_complaints(token):
+    """Test 12: Paginate complaints"""
+    print("\n🔍 Testing complaint pagination...")
+    try:
+        headers = {"Authorization": f"Bearer {token}"}
+        payload = {
+            "title": "Projector broken",
+            "description": "The projector in room 204 does not turn on.",
+            "category": "facilities",
+            "department": "facilities-management",
+            "isAnonymous": False
+        }
+        response = requests.post(f"{BASE_URL}/api/complaints", json=payload, headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        response = requests.get(f"{BASE_URL}/api/complaints?limit=1", headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        first = response.json()
+        assert len(first["items"]) == 1, f"Expected 1 complaint on first page, got {len(first['items'])}"
+        assert first.get("nextCursor") == 1, f"Expected nextCursor 1, got {first.get('nextCursor')}"
+
+        response = requests.get(f"{BASE_URL}/api/complaints?limit=1&skip={first['nextCursor']}", headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        second = response.json()
+        assert len(second["items"]) == 1, f"Expected 1 complaint on second page, got {len(second['items'])}"
+        assert second.get("nextCursor") is None, f"Expected no next page, got {second.get('nextCursor')}"
+        assert first["items"][0]["id"] != second["items"][0]["id"], "Pages returned the same complaint"
+        print("✅ Complaint pagination passed")
+        return True
+    except Exception as e:
+        print(f"❌ Complaint pagination failed: {e}")
+        return False
+
+def test_invalid_skip(token):
+    """Test 13: Reject out-of-range skip"""
+    print("\n🔍 Testing invalid pagination skip...")
+    try:
+        headers = {"Authorization": f"Bearer {token}"}
+        for skip in ("1e400", "1e30", "-1", "1.5", "abc"):
+            response = requests.get(f"{BASE_URL}/api/complaints?skip={skip}", headers=headers)
+            assert response.status_code == 400, f"Expected 400 for skip={skip}, got {response.status_code}: {response.text}"
+        print("✅ Invalid skip test passed")
+        return True
+    except Exception as e:
+        print(f"❌ Invalid skip test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🚀 Starting University Complaint Box Backend Smoke Tests")
@@ -229,7 +277,7 @@ def main():
     
     # Test sequence
     tests_passed = 0
-    total_tests = 11
+    total_tests = 13
     
     # Test 1: Health check
     if test_health_check():
@@ -287,6 +335,14 @@ def main():
     if test_negative_student_status_update(student_token, complaint_id):
         tests_passed += 1
     
+    # Test 12: Pagination
+    if test_paginate_complaints(student_token):
+        tests_passed += 1
+    
+    # Test 13: Invalid skip
+    if test_invalid_skip(student_token):
+        tests_passed += 1
+    
     # Summary
     print(f"\n📊 Test Results: {tests_passed}/{total_tests} tests passed")
     
@@ -4,6 +4,10 @@
 
 export type LoginResponse = { access_token: string; token_type: string };
 
+// Complaint as sent over the wire (dates are still ISO strings)
+type ComplaintWire = { id: string; [key: string]: unknown };
+type ComplaintPage = { items: ComplaintWire[]; nextCursor: number | null };
+
 const getBackendUrl = (): string => {
 	// Per platform rules, the frontend must use REACT_APP_BACKEND_URL
 	// We try both import.meta.env and process.env for compatibility
@@ -80,12 +84,24 @@ export const api = {
 
 	// COMPLAINTS
 	async getComplaints(status_filter?: string) {
-		// Build URL via string concatenation for compatibility across environments
-		const full = `${getBackendUrl()}/complaints${
-			status_filter ? `?status_filter=${encodeURIComponent(status_filter)}` : ""
-		}`;
-		const res = await fetch(full, { headers: withAuthHeaders() });
-		return handleResponse(res);
+		// The list endpoint is paginated; follow nextCursor until every page is loaded.
+		// Offsets shift when a complaint is created between page fetches, so the same
+		// complaint can appear on two pages; keep the first copy of each id.
+		const byId = new Map<string, ComplaintWire>();
+		let skip: number | null = 0;
+		while (skip !== null) {
+			// Build URL via string concatenation for compatibility across environments
+			const full = `${getBackendUrl()}/complaints?limit=500&skip=${skip}${
+				status_filter ? `&status_filter=${encodeURIComponent(status_filter)}` : ""
+			}`;
+			const res = await fetch(full, { headers: withAuthHeaders() });
+			const page: ComplaintPage = await handleResponse(res);
+			for (const item of page.items) {
+				if (!byId.has(item.id)) byId.set(item.id, item);
+			}
+			skip = page.nextCursor;
+		}
+		return [...byId.values()];
 	},
 
 	async createComplaint(body: {